@@ -2,9 +2,10 @@
 
 import datetime
 import logging
+from dataclasses import dataclass
 
-import requests
-from dateutil.rrule import WEEKLY, rrule
+import aiohttp
+from dateutil.rrule import DAILY, rrule
 
 LOGGER = logging.getLogger(__name__)
 
@@ -12,7 +13,25 @@ API_ENDPOINT = (
     "https://api.yasno.com.ua/api/v1/pages/home/schedule-turn-off-electricity"
 )
 START_OF_DAY = 0
-END_OF_DAY = 24
+GROUP_PREFIX = "group_"
+
+
+@dataclass(frozen=True, slots=True)
+class OutageEvent:
+    """Outage event of a group schedule."""
+
+    summary: str
+    start: datetime.datetime
+    end: datetime.datetime
+
+
+@dataclass(frozen=True, slots=True)
+class OutageSlot:
+    """Outage event of a weekday schedule, relative to the start of the day."""
+
+    summary: str
+    start: datetime.timedelta
+    end: datetime.timedelta
 
 
 class YasnoOutagesApi:
@@ -21,13 +40,34 @@ class YasnoOutagesApi:
     """Group name format"""
     group_name = "group_{group}"
 
-    def __init__(self, city: str | None = None, group: str | None = None) -> None:
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        city: str | None = None,
+        group: str | None = None,
+    ) -> None:
         """Initialize the YasnoOutagesApi."""
+        self.session = session
         self.group = group
         self.city = city
         self.api_url = API_ENDPOINT
         self.schedule = None
 
+    @property
+    def schedule(self) -> dict | None:
+        """Return the fetched schedule."""
+        return self._schedule
+
+    @schedule.setter
+    def schedule(self, schedule: dict | None) -> None:
+        """Set the schedule and index its group names by city."""
+        self._schedule = schedule
+        self._weekday_slots: dict[tuple[str, str], tuple] = {}
+        self._group_indexes = {
+            city: tuple(group.removeprefix(GROUP_PREFIX) for group in groups)
+            for city, groups in (schedule or {}).items()
+        }
+
     def _extract_schedule(self, data: dict) -> dict | None:
         """Extract schedule from the API response."""
         schedule_component = next(
@@ -50,15 +90,21 @@ class YasnoOutagesApi:
     ) -> datetime.datetime:
         return date.replace(hour=start_hour, minute=0, second=0, microsecond=0)
 
-    def fetch_schedule(self) -> None:
+    async def fetch_schedule(self) -> None:
         """Fetch outages from the API."""
         try:
-            response = requests.get(self.api_url, timeout=60)
-            response.raise_for_status()
-            self.schedule = self._extract_schedule(response.json())
-        except requests.RequestException as error:
+            async with self.session.get(
+                self.api_url,
+                timeout=aiohttp.ClientTimeout(total=60),
+            ) as response:
+                response.raise_for_status()
+                schedule = self._extract_schedule(await response.json())
+        except (aiohttp.ClientError, TimeoutError, ValueError) as error:
             LOGGER.exception("Error fetching schedule from Yasno API: %s", error)  # noqa: TRY401
-            self.schedule = {}
+            return
+        # Keep the last good schedule when the response has none
+        if schedule is not None:
+            self.schedule = schedule
 
     def get_cities(self) -> list[str]:
         """Get a list of available cities."""
@@ -68,68 +114,74 @@ class YasnoOutagesApi:
         """Get all schedules for all of available groups for a city."""
         return self.schedule.get(city, {}) if self.schedule else {}
 
+    def get_group_indexes(self, city: str) -> tuple[str, ...]:
+        """Get the indexes of all groups available for a city."""
+        return self._group_indexes.get(city, ())
+
     def get_group_schedule(self, city: str, group: str) -> list:
         """Get the schedule for a specific group."""
         city_groups = self.get_city_groups(city)
         return city_groups.get(self.group_name.format(group=group), [])
 
-    def get_current_event(self, at: datetime.datetime) -> dict | None:
-        """Get the current event."""
-        for event in self.get_events(at, at + datetime.timedelta(days=1)):
-            if event["start"] <= at < event["end"]:
-                return event
-        return None
+    def get_weekday_slots(self) -> tuple[list[OutageSlot], ...]:
+        """Get the slots of each weekday, sorted by start."""
+        key = (self.city, self.group)
+        if key not in self._weekday_slots:
+            weekday_slots = []
+            for day_events in self.get_group_schedule(self.city, self.group):
+                slots = sorted(
+                    (
+                        OutageSlot(
+                            summary=event["type"],
+                            start=datetime.timedelta(hours=event["start"]),
+                            end=datetime.timedelta(hours=event["end"]),
+                        )
+                        for event in day_events
+                    ),
+                    key=lambda slot: slot.start,
+                )
+                weekday_slots.append(slots)
+            self._weekday_slots[key] = tuple(weekday_slots)
+        return self._weekday_slots[key]
 
     def get_events(
         self,
         start_date: datetime.datetime,
         end_date: datetime.datetime,
-    ) -> list[dict]:
+    ) -> list[OutageEvent]:
         """Get all events."""
         if not self.city or not self.group:
             return []
-        group_schedule = self.get_group_schedule(self.city, self.group)
+        weekday_slots = self.get_weekday_slots()
         events = []
 
-        # For each day of the week in the schedule
-        for dow, day_events in enumerate(group_schedule):
-            # Build a recurrence rule the events between start and end dates
-            recurrance_rule = rrule(
-                WEEKLY,
-                dtstart=start_date,
-                until=end_date,
-                byweekday=dow,
-            )
-
-            # For each event in the day
-            for event in day_events:
-                event_start_hour = event["start"]
-                event_end_hour = event["end"]
-
-                if event_end_hour == END_OF_DAY:
-                    event_end_hour = START_OF_DAY
-
-                # For each date in the recurrence rule
-                for dt in recurrance_rule:
-                    event_start = self._build_event_hour(dt, event_start_hour)
-                    event_end = self._build_event_hour(dt, event_end_hour)
-                    if event_end_hour == START_OF_DAY:
-                        event_end += datetime.timedelta(days=1)
-                    if (
-                        start_date <= event_start <= end_date
-                        or start_date <= event_end <= end_date
-                        # Include events that intersect beyond the timeframe
-                        # See: https://github.com/denysdovhan/ha-yasno-outages/issues/14
-                        or event_start <= start_date <= event_end
-                        or event_start <= end_date <= event_end
-                    ):
-                        events.append(
-                            {
-                                "summary": event["type"],
-                                "start": event_start,
-                                "end": event_end,
-                            },
-                        )
-
-        # Sort events by start time to ensure correct order
-        return sorted(events, key=lambda event: event["start"])
+        # Events never span midnight and each day's slots are sorted, so
+        # walking days in order yields events sorted by start. Days start at
+        # midnight so the last one is kept whatever end_date's time of day
+        first_day = self._build_event_hour(start_date, START_OF_DAY)
+        for dt in rrule(DAILY, dtstart=first_day, until=end_date):
+            dow = dt.weekday()
+            if dow >= len(weekday_slots):
+                continue
+            day_start = self._build_event_hour(dt, START_OF_DAY)
+
+            for slot in weekday_slots[dow]:
+                event_start = day_start + slot.start
+                event_end = day_start + slot.end
+                if (
+                    start_date <= event_start <= end_date
+                    or start_date <= event_end <= end_date
+                    # Include events that intersect beyond the timeframe
+                    # See: https://github.com/denysdovhan/ha-yasno-outages/issues/14
+                    or event_start <= start_date <= event_end
+                    or event_start <= end_date <= event_end
+                ):
+                    events.append(
+                        OutageEvent(
+                            summary=slot.summary,
+                            start=event_start,
+                            end=event_end,
+                        ),
+                    )
+
+        return events
@@ -15,6 +15,12 @@ from .entity import YasnoOutagesEntity
 
 LOGGER = logging.getLogger(__name__)
 
+CALENDAR_DESCRIPTION = EntityDescription(
+    key="calendar",
+    name="Calendar",
+    translation_key="calendar",
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,  # noqa: ARG001
@@ -36,11 +42,7 @@ class YasnoOutagesCalendar(YasnoOutagesEntity, CalendarEntity):
     ) -> None:
         """Initialize the YasnoOutagesCalendar entity."""
         super().__init__(coordinator)
-        self.entity_description = EntityDescription(
-            key="calendar",
-            name="Calendar",
-            translation_key="calendar",
-        )
+        self.entity_description = CALENDAR_DESCRIPTION
         self._attr_unique_id = (
             f"{coordinator.config_entry.entry_id}-"
             f"{coordinator.group}-"
@@ -1,16 +1,21 @@
 """Config flow for Yasno Outages integration."""
 
 import logging
-from typing import Any
+import time
+from collections.abc import Mapping
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
 from homeassistant.config_entries import (
     ConfigEntry,
+    ConfigEntryState,
     ConfigFlow,
     ConfigFlowResult,
     OptionsFlow,
 )
-from homeassistant.core import callback
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.selector import (
     SelectSelector,
     SelectSelectorConfig,
@@ -18,84 +23,114 @@ from homeassistant.helpers.selector import (
 
 from .api import YasnoOutagesApi
 from .const import CONF_CITY, CONF_GROUP, DEFAULT_CITY, DEFAULT_GROUP, DOMAIN, NAME
+from .helpers import get_config_view
+
+if TYPE_CHECKING:
+    from .coordinator import YasnoOutagesCoordinator
 
 LOGGER = logging.getLogger(__name__)
 
-GROUP_PREFIX = "group_"
+# Seconds a fetched schedule is reused by subsequent flows
+SCHEDULE_CACHE_TTL = 300
 
+# Last fetched schedule per API URL, with its monotonic fetch time
+_SCHEDULE_CACHE: dict[str, tuple[float, dict]] = {}
 
-def extract_group_index(group: str) -> str:
-    """Extract the group index from the group name."""
-    return group[len(GROUP_PREFIX) :]
 
+async def async_fetch_schedule(api: YasnoOutagesApi) -> None:
+    """Fetch the schedule, reusing a recent one fetched by any flow."""
+    cached = _SCHEDULE_CACHE.get(api.api_url)
+    if cached and time.monotonic() - cached[0] < SCHEDULE_CACHE_TTL:
+        api.schedule = cached[1]
+        return
 
-def get_config_value(
-    entry: ConfigEntry | None,
-    key: str,
-    default: Any = None,
-) -> Any:
-    """Get a value from the config entry or default."""
-    if entry is not None:
-        return entry.options.get(key, entry.data.get(key, default))
-    return default
+    await api.fetch_schedule()
+    if api.schedule:
+        _SCHEDULE_CACHE[api.api_url] = (time.monotonic(), api.schedule)
 
 
-def build_city_schema(
-    api: YasnoOutagesApi,
-    config_entry: ConfigEntry | None,
+@lru_cache(maxsize=32)
+def _build_select_schema(
+    key: str,
+    options: tuple[str, ...],
+    default: str,
 ) -> vol.Schema:
-    """Build the schema for the city selection step."""
-    cities = api.get_cities()
+    """Build a single select field schema for the given options."""
     return vol.Schema(
         {
-            vol.Required(
-                CONF_CITY,
-                default=get_config_value(config_entry, CONF_CITY, DEFAULT_CITY),
-            ): SelectSelector(
+            vol.Required(key, default=default): SelectSelector(
                 SelectSelectorConfig(
-                    options=cities,
-                    translation_key="city",
+                    options=list(options),
+                    translation_key=key,
                 ),
             ),
         },
     )
 
 
+def build_city_schema(
+    cities: tuple[str, ...],
+    config: Mapping[str, Any],
+) -> vol.Schema:
+    """Build the schema for the city selection step."""
+    return _build_select_schema(
+        CONF_CITY,
+        cities,
+        config.get(CONF_CITY, DEFAULT_CITY),
+    )
+
+
 def build_group_schema(
-    api: YasnoOutagesApi,
-    config_entry: ConfigEntry | None,
-    data: dict,
+    group_indexes: tuple[str, ...],
+    config: Mapping[str, Any],
 ) -> vol.Schema:
     """Build the schema for the group selection step."""
-    city = data[CONF_CITY]
-    groups = api.get_city_groups(city).keys()
-    group_indexes = [extract_group_index(group) for group in groups]
-    LOGGER.debug("Getting %s groups: %s", city, groups)
-
-    return vol.Schema(
-        {
-            vol.Required(
-                CONF_GROUP,
-                default=get_config_value(config_entry, CONF_GROUP, DEFAULT_GROUP),
-            ): SelectSelector(
-                SelectSelectorConfig(
-                    options=group_indexes,
-                    translation_key="group",
-                ),
-            ),
-        },
+    return _build_select_schema(
+        CONF_GROUP,
+        group_indexes,
+        config.get(CONF_GROUP, DEFAULT_GROUP),
     )
 
 
-class YasnoOutagesOptionsFlow(OptionsFlow):
+class YasnoOutagesFlowMixin:
+    """Common logic for Yasno Outages config and options flows."""
+
+    hass: HomeAssistant
+    cities: tuple[str, ...] = ()
+
+    @cached_property
+    def api(self) -> YasnoOutagesApi:
+        """Return the API, created on first use."""
+        api = YasnoOutagesApi(session=async_get_clientsession(self.hass))
+        self._seed_api(api)
+        return api
+
+    def _seed_api(self, api: YasnoOutagesApi) -> None:
+        """Seed a newly created API with already known data."""
+
+    async def async_load_schedule(self) -> None:
+        """Load the schedule, fetching it at most once per flow."""
+        if not self.api.schedule:
+            await async_fetch_schedule(self.api)
+        if not self.cities:
+            self.cities = tuple(self.api.get_cities())
+
+
+class YasnoOutagesOptionsFlow(YasnoOutagesFlowMixin, OptionsFlow):
     """Handle options flow for Yasno Outages."""
 
     def __init__(self, config_entry: ConfigEntry) -> None:
         """Initialize options flow."""
         self.config_entry = config_entry
-        self.api = YasnoOutagesApi()
+        self.config_view = get_config_view(config_entry)
         self.data: dict[str, Any] = {}
 
+    def _seed_api(self, api: YasnoOutagesApi) -> None:
+        """Seed the API with the schedule of a loaded entry."""
+        if self.config_entry.state is ConfigEntryState.LOADED:
+            coordinator: YasnoOutagesCoordinator = self.config_entry.runtime_data
+            api.schedule = coordinator.api.schedule
+
     async def async_step_init(self, user_input: dict | None = None) -> ConfigFlowResult:
         """Handle the city change."""
         if user_input is not None:
@@ -103,14 +138,19 @@ class YasnoOutagesOptionsFlow(OptionsFlow):
             self.data.update(user_input)
             return await self.async_step_group()
 
-        await self.hass.async_add_executor_job(self.api.fetch_schedule)
+        await self.async_load_schedule()
 
         LOGGER.debug("Options: %s", self.config_entry.options)
         LOGGER.debug("Data: %s", self.config_entry.data)
 
+        if len(self.cities) == 1:
+            LOGGER.debug("Only one city available, selecting: %s", self.cities[0])
+            self.data[CONF_CITY] = self.cities[0]
+            return await self.async_step_group()
+
         return self.async_show_form(
             step_id="init",
-            data_schema=build_city_schema(api=self.api, config_entry=self.config_entry),
+            data_schema=build_city_schema(self.cities, self.config_view),
         )
 
     async def async_step_group(
@@ -123,24 +163,27 @@ class YasnoOutagesOptionsFlow(OptionsFlow):
             self.data.update(user_input)
             return self.async_create_entry(title="", data=self.data)
 
+        group_indexes = self.api.get_group_indexes(self.data[CONF_CITY])
+        LOGGER.debug("Getting %s groups: %s", self.data[CONF_CITY], group_indexes)
+        if len(group_indexes) == 1:
+            LOGGER.debug("Only one group available, selecting: %s", group_indexes[0])
+            self.data[CONF_GROUP] = group_indexes[0]
+            return self.async_create_entry(title="", data=self.data)
+
         return self.async_show_form(
             step_id="group",
-            data_schema=build_group_schema(
-                api=self.api,
-                config_entry=self.config_entry,
-                data=self.data,
-            ),
+            data_schema=build_group_schema(group_indexes, self.config_view),
         )
 
 
-class YasnoOutagesConfigFlow(ConfigFlow, domain=DOMAIN):
+class YasnoOutagesConfigFlow(YasnoOutagesFlowMixin, ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Yasno Outages."""
 
     VERSION = 1
 
     def __init__(self) -> None:
         """Initialize config flow."""
-        self.api = YasnoOutagesApi()
+        self.config_view = get_config_view(None)
         self.data: dict[str, Any] = {}
 
     @staticmethod
@@ -156,11 +199,16 @@ class YasnoOutagesConfigFlow(ConfigFlow, domain=DOMAIN):
             self.data.update(user_input)
             return await self.async_step_group()
 
-        await self.hass.async_add_executor_job(self.api.fetch_schedule)
+        await self.async_load_schedule()
+
+        if len(self.cities) == 1:
+            LOGGER.debug("Only one city available, selecting: %s", self.cities[0])
+            self.data[CONF_CITY] = self.cities[0]
+            return await self.async_step_group()
 
         return self.async_show_form(
             step_id="user",
-            data_schema=build_city_schema(api=self.api, config_entry=None),
+            data_schema=build_city_schema(self.cities, self.config_view),
         )
 
     async def async_step_group(
@@ -173,11 +221,14 @@ class YasnoOutagesConfigFlow(ConfigFlow, domain=DOMAIN):
             self.data.update(user_input)
             return self.async_create_entry(title=NAME, data=self.data)
 
+        group_indexes = self.api.get_group_indexes(self.data[CONF_CITY])
+        LOGGER.debug("Getting %s groups: %s", self.data[CONF_CITY], group_indexes)
+        if len(group_indexes) == 1:
+            LOGGER.debug("Only one group available, selecting: %s", group_indexes[0])
+            self.data[CONF_GROUP] = group_indexes[0]
+            return self.async_create_entry(title=NAME, data=self.data)
+
         return self.async_show_form(
             step_id="group",
-            data_schema=build_group_schema(
-                api=self.api,
-                config_entry=None,
-                data=self.data,
-            ),
+            data_schema=build_group_schema(group_indexes, self.config_view),
         )
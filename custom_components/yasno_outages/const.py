@@ -26,5 +26,5 @@ EVENT_NAME_OFF: Final = "DEFINITE_OUTAGE"
 EVENT_NAME_MAYBE: Final = "POSSIBLE_OUTAGE"
 
 # Keys
-TRANSLATION_KEY_EVENT_OFF: Final = f"component.{DOMAIN}.common.electricity_off"
-TRANSLATION_KEY_EVENT_MAYBE: Final = f"component.{DOMAIN}.common.electricity_maybe"
+TRANSLATION_KEY_EVENT_OFF: Final = "component.yasno_outages.common.electricity_off"
+TRANSLATION_KEY_EVENT_MAYBE: Final = "component.yasno_outages.common.electricity_maybe"
@@ -1,16 +1,23 @@
 """Coordinator for Yasno outages integration."""
 
+import asyncio
+import bisect
 import datetime
 import logging
+from collections import OrderedDict
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Final, NamedTuple
 
 from homeassistant.components.calendar import CalendarEvent
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.translation import async_get_translations
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_utils
 
-from .api import YasnoOutagesApi
+from .api import OutageEvent, YasnoOutagesApi
 from .const import (
     CONF_CITY,
     CONF_GROUP,
@@ -25,10 +32,30 @@ from .const import (
     TRANSLATION_KEY_EVENT_OFF,
     UPDATE_INTERVAL,
 )
+from .helpers import get_config_view
 
 LOGGER = logging.getLogger(__name__)
 
 TIMEFRAME_TO_CHECK = datetime.timedelta(hours=24)
+EVENTS_CACHE_SIZE = 8
+EVENT_INDEX_TIMEFRAME = datetime.timedelta(hours=48)
+
+SUMMARY_TO_STATE: Final[Mapping[str | None, str]] = MappingProxyType(
+    {
+        None: STATE_ON,
+        EVENT_NAME_OFF: STATE_OFF,
+        EVENT_NAME_MAYBE: STATE_MAYBE,
+    },
+)
+
+
+class OutagesSnapshot(NamedTuple):
+    """Outage state and upcoming changes at a moment in time."""
+
+    current_state: str
+    next_outage: datetime.date | datetime.datetime | None
+    next_possible_outage: datetime.date | datetime.datetime | None
+    next_connectivity: datetime.date | datetime.datetime | None
 
 
 class YasnoOutagesCoordinator(DataUpdateCoordinator):
@@ -47,28 +74,31 @@ class YasnoOutagesCoordinator(DataUpdateCoordinator):
         self.hass = hass
         self.config_entry = config_entry
         self.translations = {}
-        self.city = config_entry.options.get(
-            CONF_CITY,
-            config_entry.data.get(CONF_CITY),
-        )
-        self.group = config_entry.options.get(
-            CONF_GROUP,
-            config_entry.data.get(CONF_GROUP),
-        )
+        self._translations_language: str | None = None
+        self._event_name_map: dict[str, str | None] = {}
+        self._unknown_summaries: set[str] = set()
+        self._data_version = 0
+        self._update_lock = asyncio.Lock()
+        self._events_cache: OrderedDict[tuple, list[CalendarEvent]] = OrderedDict()
+        # Upcoming events sorted by start, with their bounds in parallel lists
+        self._index_events: list[OutageEvent] = []
+        self._index_starts: list[datetime.datetime] = []
+        self._index_ends: list[datetime.datetime] = []
+        self._index_timeframe: tuple[datetime.datetime, datetime.datetime] | None = None
+        self._snapshot: tuple[tuple[int, int], OutagesSnapshot] | None = None
+        config = get_config_view(config_entry)
+        self.city = config.get(CONF_CITY)
+        self.group = config.get(CONF_GROUP)
 
         if not self.city:
             LOGGER.warning("City not set in configuration. Setting to default.")
             self.city = DEFAULT_CITY
 
-        self.api = YasnoOutagesApi(city=self.city, group=self.group)
-
-    @property
-    def event_name_map(self) -> dict:
-        """Return a mapping of event names to translations."""
-        return {
-            EVENT_NAME_OFF: self.translations.get(TRANSLATION_KEY_EVENT_OFF),
-            EVENT_NAME_MAYBE: self.translations.get(TRANSLATION_KEY_EVENT_MAYBE),
-        }
+        self.api = YasnoOutagesApi(
+            session=async_get_clientsession(hass),
+            city=self.city,
+            group=self.group,
+        )
 
     async def update_config(
         self,
@@ -82,83 +112,173 @@ class YasnoOutagesCoordinator(DataUpdateCoordinator):
         group_updated = new_group and new_group != self.group
 
         if city_updated or group_updated:
-            LOGGER.debug("Updating group from %s -> %s", self.group, new_group)
-            self.group = new_group
-            self.api = YasnoOutagesApi(city=self.city, group=self.group)
-            await self.async_refresh()
+            LOGGER.debug(
+                "Updating city/group from %s/%s -> %s/%s",
+                self.city,
+                self.group,
+                new_city,
+                new_group,
+            )
+            self.city = new_city or self.city
+            self.group = new_group or self.group
+            # The fetched schedule covers every city and group
+            self.api.city = self.city
+            self.api.group = self.group
+            self._invalidate_events()
+            self.async_update_listeners()
         else:
             LOGGER.debug("No group update necessary.")
 
     async def _async_update_data(self) -> None:
         """Fetch data from ICS file."""
-        await self.async_fetch_translations()
-        return await self.hass.async_add_executor_job(self.api.fetch_schedule)
+        # Let an overlapping refresh reuse the fetch in flight
+        if self._update_lock.locked():
+            async with self._update_lock:
+                return
+        async with self._update_lock:
+            await asyncio.gather(
+                self.async_fetch_translations(),
+                self.api.fetch_schedule(),
+            )
+            self._invalidate_events()
+
+    def _invalidate_events(self) -> None:
+        """Drop events derived from the previous schedule or group."""
+        self._data_version += 1
+        self._events_cache.clear()
+        self._index_timeframe = None
 
     async def async_fetch_translations(self) -> None:
         """Fetch translations."""
+        language = self.hass.config.language
+        if self.translations and language == self._translations_language:
+            return
         self.translations = await async_get_translations(
             self.hass,
-            self.hass.config.language,
+            language,
             "common",
             [DOMAIN],
         )
+        self._translations_language = language
+        self._event_name_map = {
+            EVENT_NAME_OFF: self.translations.get(TRANSLATION_KEY_EVENT_OFF),
+            EVENT_NAME_MAYBE: self.translations.get(TRANSLATION_KEY_EVENT_MAYBE),
+        }
+
+    def _ensure_event_index(
+        self,
+        start_date: datetime.datetime,
+        end_date: datetime.datetime,
+    ) -> None:
+        """Make sure the event index covers the given timeframe."""
+        if self._is_indexed(start_date, end_date):
+            return
+
+        index_end = max(end_date, start_date + EVENT_INDEX_TIMEFRAME)
+        self._index_events = self.api.get_events(start_date, index_end)
+        self._index_starts = [event.start for event in self._index_events]
+        self._index_ends = [event.end for event in self._index_events]
+        self._index_timeframe = (start_date, index_end)
+
+    def _is_indexed(
+        self,
+        start_date: datetime.datetime,
+        end_date: datetime.datetime,
+    ) -> bool:
+        """Check whether the event index covers the given timeframe."""
+        return (
+            self._index_timeframe is not None
+            and self._index_timeframe[0] <= start_date
+            and end_date <= self._index_timeframe[1]
+        )
 
-    def _get_next_event_of_type(self, state_type: str) -> CalendarEvent | None:
-        """Get the next event of a specific type."""
+    def _get_next_events(
+        self,
+        now: datetime.datetime,
+    ) -> dict[str, OutageEvent]:
+        """Get the next event of each state within the timeframe to check."""
+        end = now + TIMEFRAME_TO_CHECK
+        self._ensure_event_index(now, end)
+
+        next_events: dict[str, OutageEvent] = {}
+        first = bisect.bisect_right(self._index_starts, now)
+        for event in self._index_events[first:]:
+            if event.start > end:
+                break
+            next_events.setdefault(self._event_to_state(event), event)
+            if STATE_OFF in next_events and STATE_MAYBE in next_events:
+                break
+        return next_events
+
+    def _get_snapshot(self) -> OutagesSnapshot:
+        """Get the current state and upcoming changes."""
         now = dt_utils.now()
-        # Sort events to handle multi-day spanning events correctly
-        next_events = sorted(
-            self.get_events_between(
-                now,
-                now + TIMEFRAME_TO_CHECK,
-                translate=False,
+        # Schedule slots start on whole minutes
+        key = (self._data_version, int(now.timestamp()) // 60)
+        if self._snapshot is None or self._snapshot[0] != key:
+            self._snapshot = (key, self._build_snapshot(now))
+        return self._snapshot[1]
+
+    def _build_snapshot(self, now: datetime.datetime) -> OutagesSnapshot:
+        """Compute the current state and upcoming changes at a moment."""
+        current_event = self._get_outage_event_at(now)
+        current_state = self._event_to_state(current_event)
+        next_events = self._get_next_events(now)
+        next_outage = next_events.get(STATE_OFF)
+        next_possible_outage = next_events.get(STATE_MAYBE)
+        LOGGER.debug("Next outage: %s", next_outage)
+        LOGGER.debug("Next possible outage: %s", next_possible_outage)
+
+        # If current event is maybe, connectivity returns at its end,
+        # otherwise at the next maybe event's end
+        if current_state == STATE_MAYBE:
+            next_connectivity = current_event.end if current_event else None
+        else:
+            next_connectivity = (
+                next_possible_outage.end if next_possible_outage else None
+            )
+
+        return OutagesSnapshot(
+            current_state=current_state,
+            next_outage=next_outage.start if next_outage else None,
+            next_possible_outage=(
+                next_possible_outage.start if next_possible_outage else None
             ),
-            key=lambda event: event.start,
+            next_connectivity=next_connectivity,
         )
-        LOGGER.debug("Next events: %s", next_events)
-        for event in next_events:
-            if self._event_to_state(event) == state_type and event.start > now:
-                return event
-        return None
 
     @property
     def next_outage(self) -> datetime.date | datetime.datetime | None:
         """Get the next outage time."""
-        event = self._get_next_event_of_type(STATE_OFF)
-        LOGGER.debug("Next outage: %s", event)
-        return event.start if event else None
+        return self._get_snapshot().next_outage
 
     @property
     def next_possible_outage(self) -> datetime.date | datetime.datetime | None:
         """Get the next possible outage time."""
-        event = self._get_next_event_of_type(STATE_MAYBE)
-        LOGGER.debug("Next possible outage: %s", event)
-        return event.start if event else None
+        return self._get_snapshot().next_possible_outage
 
     @property
     def next_connectivity(self) -> datetime.date | datetime.datetime | None:
         """Get next connectivity time."""
-        now = dt_utils.now()
-        current_event = self.get_event_at(now)
-        # If current event is maybe, return the end time
-        if self._event_to_state(current_event) == STATE_MAYBE:
-            return current_event.end if current_event else None
-        # Otherwise, return the next maybe event's end
-        event = self._get_next_event_of_type(STATE_MAYBE)
-        LOGGER.debug("Next connectivity: %s", event)
-        return event.end if event else None
+        return self._get_snapshot().next_connectivity
 
     @property
     def current_state(self) -> str:
         """Get the current state."""
-        now = dt_utils.now()
-        event = self.get_event_at(now)
-        return self._event_to_state(event)
+        return self._get_snapshot().current_state
 
     def get_event_at(self, at: datetime.datetime) -> CalendarEvent | None:
         """Get the current event."""
-        event = self.api.get_current_event(at)
-        return self._get_calendar_event(event, translate=False)
+        return self._get_calendar_event(self._get_outage_event_at(at), translate=False)
+
+    def _get_outage_event_at(self, at: datetime.datetime) -> OutageEvent | None:
+        """Get the raw event happening at the given time."""
+        self._ensure_event_index(at, at)
+        # Events do not overlap, so only the last one started by `at` can hold it
+        index = bisect.bisect_right(self._index_starts, at) - 1
+        if index < 0 or self._index_events[index].end <= at:
+            return None
+        return self._index_events[index]
 
     def get_events_between(
         self,
@@ -168,25 +288,42 @@ class YasnoOutagesCoordinator(DataUpdateCoordinator):
         translate: bool = True,
     ) -> list[CalendarEvent]:
         """Get all events."""
-        events = self.api.get_events(start_date, end_date)
-        return [
+        key = (self._data_version, start_date, end_date, translate)
+        if key in self._events_cache:
+            self._events_cache.move_to_end(key)
+            return self._events_cache[key]
+
+        if self._is_indexed(start_date, end_date):
+            # Events do not overlap, so both bounds are sorted and the
+            # intersecting events form a contiguous slice of the index
+            first = bisect.bisect_left(self._index_ends, start_date)
+            last = bisect.bisect_right(self._index_starts, end_date)
+            events = self._index_events[first:last]
+        else:
+            events = self.api.get_events(start_date, end_date)
+        calendar_events = [
             self._get_calendar_event(event, translate=translate) for event in events
         ]  # type: ignore[return-type]
 
+        self._events_cache[key] = calendar_events
+        if len(self._events_cache) > EVENTS_CACHE_SIZE:
+            self._events_cache.popitem(last=False)
+        return calendar_events
+
     def _get_calendar_event(
         self,
-        event: dict | None,
+        event: OutageEvent | None,
         *,
         translate: bool = True,
     ) -> CalendarEvent | None:
+        """Transform an event into a CalendarEvent."""
         if not event:
             return None
 
-        """Transform an event into a CalendarEvent."""
-        event_summary = event.get("summary", None)
-        event_start = event.get("start", None)
-        event_end = event.get("end", None)
-        translated_summary = self.event_name_map.get(event_summary, None)
+        event_summary = event.summary
+        event_start = event.start
+        event_end = event.end
+        translated_summary = self._event_name_map.get(event_summary)
 
         LOGGER.debug(
             "Transforming event: %s (%s -> %s)",
@@ -202,10 +339,12 @@ class YasnoOutagesCoordinator(DataUpdateCoordinator):
             description=event_summary,
         )
 
-    def _event_to_state(self, event: CalendarEvent | None) -> str:
-        summary = event.as_dict().get("summary") if event else None
-        return {
-            None: STATE_ON,
-            EVENT_NAME_OFF: STATE_OFF,
-            EVENT_NAME_MAYBE: STATE_MAYBE,
-        }[summary]
+    def _event_to_state(self, event: OutageEvent | None) -> str:
+        summary = event.summary if event else None
+        state = SUMMARY_TO_STATE.get(summary)
+        if state is None:
+            if summary not in self._unknown_summaries:
+                self._unknown_summaries.add(summary)
+                LOGGER.warning("Unknown event type: %s", summary)
+            return STATE_ON
+        return state
@@ -0,0 +1,14 @@
+"""Helpers for Yasno outages integration."""
+
+from collections import ChainMap
+from collections.abc import Mapping
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+
+
+def get_config_view(entry: ConfigEntry | None) -> Mapping[str, Any]:
+    """Get a view of the config entry options falling back to its data."""
+    if entry is not None:
+        return ChainMap(entry.options, entry.data)
+    return {}